@@ -252,9 +252,9 @@ def __solvepress(red_infl_mat, disp):
         u_new_reduced = np.delete(disp, [p_neg], axis=0)
         g_new_reduced = np.delete(red_infl_mat, [p_neg], axis=0)
         g_new_reduced = np.delete(g_new_reduced, [p_neg], axis=1)
-        if pressure[np.where(p_index == 0)].size > 0:
-            pressure[np.where(p_index == 0)] = \
-                spla.gmres(g_new_reduced, u_new_reduced)[0]
+        p_free = p_index == 0
+        if np.count_nonzero(p_free) > 0:
+            pressure[p_free] = spla.gmres(g_new_reduced, u_new_reduced)[0]
         negative_p = np.where(pressure < 0)[0]
         p_neg = np.append(p_neg, negative_p)
 
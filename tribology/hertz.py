@@ -18,6 +18,29 @@ from tribology.boundary_element import __secant
 from tribology.tribology import profball
 
 
+def __saferecip(radius):
+    """
+
+    Calculate the reciprocal of a radius (the curvature). Radii of value
+    :code:`0` or :code:`+/- inf` describe flat surfaces and have a curvature of
+    :code:`0`.
+
+    Parameters
+    ----------
+    radius: ndarray, scalar
+        The radius.
+
+    Returns
+    -------
+    recip: ndarray
+        The reciprocal of the radius.
+
+    """
+    with np.errstate(divide='ignore'):
+        recip = 1 / np.asarray(radius, dtype=float)
+    return np.where(np.isinf(recip), 0.0, recip)
+
+
 def __rred(r_1, r_2):
     """
 
@@ -26,29 +49,24 @@ def __rred(r_1, r_2):
 
     Parameters
     ----------
-    r_1: scalar
+    r_1: ndarray, scalar
         The first radius.
-    r_2: scalar
+    r_2: ndarray, scalar
         The second radius.
 
     Returns
     -------
-    r_red: scalar
+    r_red: ndarray, scalar
         The reduced (effective) radius.
 
     """
-    if (r_1 == 0 or abs(r_1) == float('inf')) and r_2 != 0:
-        r_red = r_2
-    elif (r_2 == 0 or abs(r_2) == float('inf')) and r_1 != 0:
-        r_red = r_1
-    elif (r_1 == 0 or abs(r_1) == float('inf')) and \
-            (r_2 == 0 or abs(r_2) == float('inf')):
-        r_red = 0
-    elif r_1 == -r_2:
-        r_red = 0
-    else:
-        r_red = 1 / (1 / r_1 + 1 / r_2)
-    return r_red
+    recip_1 = __saferecip(r_1)
+    recip_2 = __saferecip(r_2)
+    recip_sum = recip_1 + recip_2
+    with np.errstate(divide='ignore'):
+        r_red = np.select([recip_sum == 0, recip_1 == 0, recip_2 == 0],
+                          [0.0, r_2, r_1], 1 / recip_sum)
+    return r_red[()]
 
 
 def reff(r_x_1, r_y_1, r_x_2, r_y_2, ):
@@ -57,36 +75,31 @@ def reff(r_x_1, r_y_1, r_x_2, r_y_2, ):
     Calculate the effective radii for two bodies according to Hertzian contact
     theory. It is assumed that the two major axis of each body (x- and y-axis)
     are perpendicular to each other and that the x and y axes of both bodies are
-    aligned.
+    aligned. Radii of value :code:`0` or :code:`+/- inf` describe flat
+    surfaces. All radii can be given as arrays of equal (or broadcastable)
+    shape.
 
     Parameters
     ----------
-    r_x_1: scalar
+    r_x_1: ndarray, scalar
         The radius of body 1 in direction 1 (x).
-    r_y_1: scalar
+    r_y_1: ndarray, scalar
         The radius of body 1 in direction 2 (y).
-    r_x_2: scalar
+    r_x_2: ndarray, scalar
         The radius of body 2 in direction 1 (x).
-    r_y_2: scalar
+    r_y_2: ndarray, scalar
         The radius of body 2 in direction 2 (y).
 
     Returns
     -------
-    r_eff: scalar
+    r_eff: ndarray, scalar
         The effective radius.
-    r_eff_x: scalar
+    r_eff_x: ndarray, scalar
         The effective radius in x-direction.
-    r_eff_y: scalar
+    r_eff_y: ndarray, scalar
         The effective radius in y-direction.
 
     """
-    recip_radius = []
-    for radius in [r_x_1, r_y_1, r_x_2, r_y_2]:
-        if radius == 0:
-            recip_radius.append(float('inf'))
-        else:
-            recip_radius.append(1 / radius)
-
     r_eff_x = __rred(r_x_1, r_x_2)
     r_eff_y = __rred(r_y_1, r_y_2)
     r_eff = __rred(r_eff_x, r_eff_y)
@@ -97,7 +110,8 @@ def eeff(e_1, nu_1, e_2, nu_2):
     """
 
     Calculate the effective (Young's) modulus of two contact bodies according
-    to Hertzian contact theory.
+    to Hertzian contact theory. Array inputs are broadcast against each other,
+    so material parameter sweeps can be evaluated in a single call.
 
     Parameters
     ----------
@@ -112,7 +126,7 @@ def eeff(e_1, nu_1, e_2, nu_2):
 
     Returns
     -------
-    e_eff: scalar
+    e_eff: ndarray, scalar
         The effective modulus.
 
     """
@@ -5,7 +5,6 @@
 This module contains functions related to lubricants and lubrication.
 
 """
-import math
 from math import log10 as lg
 from math import pi, e
 
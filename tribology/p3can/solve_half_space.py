@@ -54,11 +54,11 @@ def solve_for_pressure(profile1, profile2, normal_load, red_influ_mat,
             u_new_reduced = np.delete(u, [p_neg], axis=0)
             g_new_reduced = np.delete(red_influ_mat, [p_neg], axis=0)
             g_new_reduced = np.delete(g_new_reduced, [p_neg], axis=1)
-            if p[np.where(p_index == 0)].size > 0:
+            p_free = p_index == 0
+            if np.count_nonzero(p_free) > 0:
                 # again, lots of options available here, this seems to be the
                 # fastest for most cases
-                p[np.where(p_index == 0)] = \
-                spla.gmres(g_new_reduced, u_new_reduced)[0]
+                p[p_free] = spla.gmres(g_new_reduced, u_new_reduced)[0]
             negative_p = np.where(p < 0)[0]
             p_neg = np.append(p_neg, negative_p)
 
@@ -35,10 +35,12 @@ def abbottfirestone(trace, num_bins=100):
 
     """
     bins = np.linspace(np.amax(trace), np.amin(trace), num_bins)
-    prob_dist = []
-    for each_bin in bins:
-        prob_dist.append(
-            len(np.where(trace >= each_bin)[0]) / len(trace) * num_bins)
+
+    # number of profile heights >= each bin, from a single sort of the trace
+    sorted_trace = np.sort(trace, axis=None)
+    counts = sorted_trace.size - np.searchsorted(sorted_trace, bins,
+                                                 side='left')
+    prob_dist = counts / len(trace) * num_bins
     return bins, prob_dist
 
 
@@ -12,7 +12,9 @@ import numpy as np
 
 sys.path.insert(0, "tribology/p3can")
 
-from ..tribology import profball, profrevolve, profrolleriso
+from ..tribology import profball, profrevolve, profrolleriso, refix, \
+    radpersec2rpm, rpm2radpersec, ffourball, make_ffourball, gfourball, \
+    gfourball_vec
 from .. import hertz as th
 from .. import lubrication as tl
 from .. import boundary_element as tb
@@ -47,6 +49,16 @@ class TestTribology(unittest.TestCase):
         e_eff = th.eeff(210000, 0.3, 210000, 0.3)
         self.assertEqual(round(e_eff), 230769)
 
+    def test_effective_modulus_sweep(self):
+        """
+        assert that eeff broadcasts material parameter arrays
+        """
+        e_eff = th.eeff(np.array([[210000], [70000]]), np.array([[0.3], [0.2]]),
+                        210000, np.array([0.3, 0.25]))
+        self.assertEqual(e_eff.shape, (2, 2))
+        self.assertEqual(round(e_eff[0, 0]), 230769)
+        self.assertEqual(e_eff[1, 1], th.eeff(70000, 0.2, 210000, 0.25))
+
     def test_effective_radii_basic(self):
         """
         base test for eeff method
@@ -54,6 +66,126 @@ class TestTribology(unittest.TestCase):
         r_eff, r_eff_x, r_eff_y = th.reff(6, 0, float('inf'), 3)
         self.assertEqual([r_eff, r_eff_x, r_eff_y], [2, 6, 3])
 
+    def test_effective_radii_array(self):
+        """
+        assert that reff gives same results for arrays as for scalars
+        """
+        r_eff, r_eff_x, r_eff_y = th.reff(np.array([6, 6.35, 4]), 0,
+                                          float('inf'),
+                                          np.array([3, 6.35, -4]))
+        self.assertEqual(list(r_eff_x), [6, 6.35, 4])
+        self.assertEqual(list(r_eff_y), [3, 6.35, -4])
+        self.assertEqual(list(r_eff), [2, th.reff(6.35, 6.35, 0, 0)[0], 0])
+
+    def test_profball_small_heights(self):
+        """
+        assert that profball is accurate for profile heights that are small
+        compared to the ball radius
+        """
+        ax_x = np.array([1e-7, 1e-5, -1e-5])
+        prof = profball(ax_x, 6)
+        prof_approx = ax_x ** 2 / 12
+        self.assertTrue(np.allclose(prof, prof_approx, rtol=1e-9, atol=0))
+        self.assertTrue(np.array_equal(profball(ax_x, -6), -prof))
+
+    def test_profrevolve(self):
+        """
+        compare profrevolve to the original element-wise implementation for
+        positive and negative diameters, including surface elements (and
+        reference heights) outside of the revolved profile
+        """
+        def profrevolve_loop(prof_1d, y_axis, y_diam):
+            len_x = len(prof_1d)
+            len_y = len(y_axis)
+            prof_2d = np.zeros((len_x, len_y))
+            sign_diam = np.sign(y_diam)
+            for i_x in range(len_x):
+                for i_y in range(len_y):
+                    bracket = pow((y_diam / 2 - sign_diam * prof_1d[i_x]), 2) \
+                              - pow(y_axis[i_y], 2)
+                    if bracket <= 0:
+                        prof_2d[i_x, i_y] = abs(y_diam) / 2
+                    else:
+                        prof_2d[i_x, i_y] = abs(y_diam) / 2 - \
+                                            sign_diam * math.sqrt(bracket)
+            if y_diam > 0:
+                min_prof = prof_2d.min()
+            else:
+                min_prof = prof_2d[round(len_x / 2) - 1, round(len_x / 2) - 1]
+            prof_2d = (prof_2d - min_prof)
+            return prof_2d, prof_2d[:, math.floor(len_y / 2)]
+
+        ax_x = np.linspace(-2, 2, 21)
+        idx = round(len(ax_x) / 2) - 1
+        cases = [
+            (profball(ax_x, 3), np.linspace(-4, 4, 33), 6),
+            (profball(ax_x, -3), np.linspace(-4, 4, 33), -6),
+            (np.ones(21), np.linspace(2.5, 4, 33), 6),
+            (profball(ax_x, -3), np.linspace(4, 5, 33), -6),
+        ]
+        for prof_1d, ax_y, y_diam in cases:
+            prof_2d, y_profile = profrevolve(prof_1d, ax_y, y_diam)
+            prof_2d_ref, y_profile_ref = profrevolve_loop(prof_1d, ax_y,
+                                                          y_diam)
+            self.assertTrue(np.allclose(prof_2d, prof_2d_ref, rtol=0,
+                                        atol=1e-12))
+            self.assertTrue(np.allclose(y_profile, y_profile_ref, rtol=0,
+                                        atol=1e-12))
+            if y_diam > 0:
+                self.assertEqual(prof_2d.min(), 0)
+            else:
+                self.assertEqual(prof_2d[idx, idx], 0)
+            self.assertTrue(y_profile.flags['C_CONTIGUOUS'])
+            self.assertFalse(np.shares_memory(y_profile, prof_2d))
+            self.assertEqual(list(y_profile), list(prof_2d[:, 16]))
+
+    def test_refix_array(self):
+        """
+        assert that refix converts arrays element-wise without rounding errors
+        """
+        vals = refix(np.array([1, 2.5, -4]), 'm', 'mu')
+        self.assertEqual(list(vals), [1000, 2500, -4000])
+        self.assertEqual(refix(3, 'k'), 3000)
+
+    def test_radpersec2rpm(self):
+        """
+        assert that radpersec2rpm inverts rpm2radpersec, including zero speed
+        """
+        vel_rpm = np.array([0, 60, -1500])
+        vel_conv = radpersec2rpm(rpm2radpersec(vel_rpm))
+        self.assertTrue(np.allclose(vel_conv, vel_rpm, rtol=1e-15, atol=0))
+        self.assertEqual(radpersec2rpm(2 * math.pi), 60)
+
+    def test_gfourball_vec(self):
+        """
+        assert that gfourball_vec gives same results for arrays as gfourball
+        for scalars
+        """
+        radii = np.array([6.35, 12.7])
+        sliding_radius, contact_angle = gfourball_vec(radii, radii)
+        for idx, radius in enumerate(radii):
+            ref_radius, ref_angle = gfourball(float(radius), float(radius))
+            self.assertAlmostEqual(sliding_radius[idx], ref_radius, places=12)
+            self.assertAlmostEqual(contact_angle[idx], ref_angle, places=12)
+        list_radius, list_angle = gfourball_vec(list(radii), list(radii))
+        np.testing.assert_allclose(list_radius, sliding_radius, rtol=1e-12)
+        np.testing.assert_allclose(list_angle, contact_angle, rtol=1e-12)
+
+    def test_make_ffourball(self):
+        """
+        assert that make_ffourball gives correct normal forces for array and
+        scalar axial forces
+        """
+        ax_force = np.array([0, 100, 400])
+        norm_force = make_ffourball(6.35, 6.35)(ax_force)
+        norm_force_ref = ax_force / math.sin(gfourball(6.35, 6.35)[1]) / 3
+        self.assertTrue(np.allclose(norm_force, norm_force_ref, rtol=1e-14,
+                                    atol=0))
+        self.assertEqual([round(force, 3) for force in norm_force],
+                         [0, 40.825, 163.299])
+        self.assertEqual(round(make_ffourball(6.35, 6.35)(100), 3), 40.825)
+        self.assertEqual(round(ffourball(6.35, 6.35, 400), 3), 163.299)
+
 
 class TestBoundaryElement(unittest.TestCase):
     """
@@ -486,6 +618,16 @@ class TestRoughSurfaces(unittest.TestCase):
         self.assertEqual(np.round(np.std(heights), 5), 0.1)
         self.assertLess(abs(np.mean(heights)), 10**-16)
 
+    def test_abbottfirestone(self):
+        """
+        base test for abbottfirestone method
+        """
+        trace = np.array([0.0, 1.0, 1.0, 2.0, 3.0, -1.0, 0.5, 2.0])
+        bins, prob_dist = rs.abbottfirestone(trace, num_bins=5)
+        self.assertIsInstance(prob_dist, np.ndarray)
+        self.assertEqual(list(bins), [3.0, 2.0, 1.0, 0.0, -1.0])
+        self.assertEqual(list(prob_dist), [0.625, 1.875, 3.125, 4.375, 5.0])
+
 
 class TestSlimMapper(unittest.TestCase):
     """
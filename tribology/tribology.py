@@ -6,11 +6,42 @@ The functions in this module are related to tribology in general.
 
 """
 
+from functools import lru_cache
 from math import sqrt, acos, cos, sin, pi, floor
 
+import numexpr as ne
 import numpy as np
 
 
+# decimal exponents of SI unit prefixes
+__SI_PREFIX = {
+    'p': -12,
+    'n': -9,
+    'mu': -6,
+    'm': -3,
+    '': 0,
+    'k': 3,
+    'M': 6,
+    'G': 9,
+    'T': 12,
+}
+
+# conversion factors for all combinations of SI unit prefixes
+__SI_FACTOR = {
+    (p_in, p_out): 10.0 ** (exp_in - exp_out)
+    for p_in, exp_in in __SI_PREFIX.items()
+    for p_out, exp_out in __SI_PREFIX.items()
+}
+
+__RPM2RADPERSEC = 2 * pi / 60
+__RADPERSEC2RPM = 60 / (2 * pi)
+
+# ball-on-3-plates factors for the default plate angle of 45 degree
+__PLATE_ANGLE = 1.5708
+__RBALL3PLATES = sin((pi - __PLATE_ANGLE) / 2)
+__FBALL3PLATES = 1 / (3 * cos(__PLATE_ANGLE / 2))
+
+
 def profrolleriso(x_axis, diam, length):
     """
 
@@ -71,8 +102,18 @@ def profball(x_axis, r_ball):
         The profile heights along the **x_axis**.
 
     """
-    prof = np.array(abs(r_ball) - np.sqrt(r_ball ** 2 - np.power(x_axis, 2)))
-    prof_heights = prof * np.sign(r_ball)
+    # r - sqrt(r^2 - x^2) rewritten as x^2 / (r + sqrt(r^2 - x^2)) to avoid
+    # cancellation for small profile heights; intermediate results are written
+    # in place to avoid temporary arrays
+    x_axis = np.asarray(x_axis, dtype=np.float64)
+    prof_heights = np.square(np.atleast_1d(x_axis))
+    denom = np.subtract(r_ball ** 2, prof_heights)
+    np.sqrt(denom, out=denom)
+    denom += abs(r_ball)
+    np.divide(prof_heights, denom, out=prof_heights)
+    if r_ball < 0:
+        np.negative(prof_heights, out=prof_heights)
+    prof_heights = prof_heights.reshape(x_axis.shape)[()]
     return prof_heights
 
 
@@ -103,22 +144,39 @@ def profrevolve(prof_1d, y_axis, y_diam):
     """
     len_x = len(prof_1d)
     len_y = len(y_axis)
-    prof_2d = np.zeros((len_x, len_y))
     sign_diam = np.sign(y_diam)
-    for i_x in range(len_x):
-        for i_y in range(len_y):
-            bracket = pow((y_diam / 2 - sign_diam * prof_1d[i_x]), 2)\
-                      - pow(y_axis[i_y], 2)
-            if bracket <= 0:
-                prof_2d[i_x, i_y] = abs(y_diam) / 2
-            else:
-                prof_2d[i_x, i_y] = abs(y_diam) / 2 - sign_diam * sqrt(bracket)
+    half_diam = abs(y_diam) / 2
+
+    prof_1d = np.asarray(prof_1d, dtype=np.float64)
+    y_axis = np.asarray(y_axis, dtype=np.float64)
+    diff_sq = ((y_diam / 2 - sign_diam * prof_1d) ** 2)[:, np.newaxis]
+    y_sq = (y_axis ** 2)[np.newaxis, :]
+
+    # the reference height follows from the 1D inputs, hence the shift is
+    # folded into the kernel instead of taking extra passes over the surface
     if y_diam > 0:
-        min_prof = prof_2d.min()
+        bracket = np.amax(diff_sq) - np.amin(y_sq)
     else:
-        min_prof = prof_2d[round(len_x / 2) - 1, round(len_x / 2) - 1]
-    prof_2d = (prof_2d - min_prof)
-    y_profile = prof_2d[:, floor(len_y / 2)]
+        idx = round(len_x / 2) - 1
+        bracket = diff_sq[idx, 0] - y_sq[0, idx]
+    if bracket <= 0:
+        min_prof = half_diam
+    else:
+        min_prof = half_diam - sign_diam * sqrt(bracket)
+
+    # broadcast x (rows) against y (columns); numexpr evaluates the bracket,
+    # square root, case distinction and shift in a single multi-threaded pass
+    prof_2d = ne.evaluate('where(diff_sq - y_sq <= 0, half_diam, '
+                          'half_diam - sign_diam * sqrt(diff_sq - y_sq)) - '
+                          'min_prof',
+                          local_dict={
+                              'diff_sq': diff_sq,
+                              'y_sq': y_sq,
+                              'half_diam': half_diam,
+                              'sign_diam': sign_diam,
+                              'min_prof': min_prof,
+                          })
+    y_profile = np.ascontiguousarray(prof_2d[:, floor(len_y / 2)])
     return prof_2d, y_profile
 
 
@@ -194,8 +252,8 @@ def srr(vel_1, vel_2):
 def radpersec2rpm(vel_rad_per_sec):
     """
 
-    Convert velocity from rotations per minute (rpm) to radians per second
-    (rad/s).
+    Convert velocity from radians per second (rad/s) to rotations per minute
+    (rpm).
 
 
     Parameters
@@ -209,15 +267,15 @@ def radpersec2rpm(vel_rad_per_sec):
         The velocity in rotations per minute.
 
     """
-    vel_rpm = 1 / rpm2radpersec(1 / vel_rad_per_sec)
+    vel_rpm = vel_rad_per_sec * __RADPERSEC2RPM
     return vel_rpm
 
 
 def rpm2radpersec(vel_rpm):
     """
 
-     Convert velocity from radians per second (rad/s) to rotations per minute
-     (rpm).
+     Convert velocity from rotations per minute (rpm) to radians per second
+     (rad/s).
 
 
      Parameters
@@ -231,11 +289,11 @@ def rpm2radpersec(vel_rpm):
          The velocity in radians per second.
 
      """
-    vel_rad_per_sec = vel_rpm / 60 * 2 * pi
+    vel_rad_per_sec = vel_rpm * __RPM2RADPERSEC
     return vel_rad_per_sec
 
 
-def rball3plates(r_ball, plate_angle=1.5708):
+def rball3plates(r_ball, plate_angle=__PLATE_ANGLE):
     """
 
     Calculate the sliding radius (lever arm) for a ball-on-3-plates test setup.
@@ -254,11 +312,14 @@ def rball3plates(r_ball, plate_angle=1.5708):
         The sliding radius.
 
     """
-    r_slide = r_ball * np.sin((pi - plate_angle) / 2)
+    if plate_angle is __PLATE_ANGLE:
+        r_slide = r_ball * __RBALL3PLATES
+    else:
+        r_slide = r_ball * np.sin((pi - plate_angle) / 2)
     return r_slide
 
 
-def fball3plates(ax_force, plate_angle=1.5708):
+def fball3plates(ax_force, plate_angle=__PLATE_ANGLE):
     """
 
     Calculate the normal force per contact in ball-on-3-plates setup.
@@ -277,14 +338,21 @@ def fball3plates(ax_force, plate_angle=1.5708):
         The normal force acting in each ball-plate contact.
 
     """
-    norm_force = ax_force / 3 / np.cos(plate_angle / 2)
+    if plate_angle is __PLATE_ANGLE:
+        norm_force = ax_force * __FBALL3PLATES
+    else:
+        norm_force = ax_force / 3 / np.cos(plate_angle / 2)
     return norm_force
 
 
+@lru_cache(maxsize=128)
 def gfourball(r_1, r_2):
     """
 
-    Geometric parameters of 4-ball setup
+    Geometric parameters of 4-ball setup. Results are cached, since the
+    function is usually called repeatedly for the same ball radii. The radii
+    must therefore be hashable scalars (e.g., :code:`float`); arrays are not
+    supported. Use :code:`gfourball_vec` for arrays of radii.
 
     Parameters
     ----------
@@ -307,6 +375,35 @@ def gfourball(r_1, r_2):
     return sliding_radius, contact_angle
 
 
+def gfourball_vec(r_1, r_2):
+    """
+
+    Geometric parameters of 4-ball setup for arrays of ball radii. See
+    :code:`gfourball` for scalar radii.
+
+    Parameters
+    ----------
+    r_1 : ndarray, scalar
+        The radius of the rotating ball.
+    r_2 : ndarray, scalar
+        The radius of the (a) stationary ball.
+
+    Returns
+    -------
+    sliding_radius : ndarray
+        The sliding radius (lever arm) on the rotating ball.
+    contact_angle : ndarray
+        Contact angle between direction of ball normal force and vertical axis.
+
+    """
+    r_1 = np.asarray(r_1, dtype=float)
+    r_2 = np.asarray(r_2, dtype=float)
+    r_circum_circle = np.sqrt(3) / 3 * 2 * r_2
+    contact_angle = np.arccos(r_circum_circle / (r_1 + r_2))
+    sliding_radius = r_circum_circle - r_2 * np.cos(contact_angle)
+    return sliding_radius, contact_angle
+
+
 def ffourball(r_1, r_2, ax_force):
     """
 
@@ -328,10 +425,42 @@ def ffourball(r_1, r_2, ax_force):
 
     """
     _, contact_angle = gfourball(r_1, r_2)
-    norm_force = ax_force / sin(contact_angle) / 3
+    norm_force = ax_force / (3 * sin(contact_angle))
     return norm_force
 
 
+def make_ffourball(r_1, r_2):
+    """
+
+    Create a function that calculates the normal force per contact in a 4-ball
+    test setup for fixed ball radii. The geometry is evaluated only once, which
+    makes the returned function suitable for long time series of axial forces.
+
+    Parameters
+    ----------
+    r_1: scalar
+        The radius of the rotating ball.
+    r_2: scalar
+        The radius of the stationary balls.
+
+    Returns
+    -------
+    ffourball_fixed: function
+        A function that takes the force acting along the rotational axis of the
+        rotating ball (ndarray, scalar) and returns the normal force in a
+        single ball-ball contact (ndarray, scalar).
+
+    """
+    _, contact_angle = gfourball(r_1, r_2)
+    force_factor = 1 / (3 * sin(contact_angle))
+
+    def ffourball_fixed(ax_force):
+        """Calculate the normal force per contact for an axial force"""
+        return ax_force * force_factor
+
+    return ffourball_fixed
+
+
 def refix(val, p_in="", p_out=""):
     """
 
@@ -355,8 +484,8 @@ def refix(val, p_in="", p_out=""):
 
     Parameters
     ----------
-    val: scalar
-        The value for which to convert the unit prefix.
+    val: ndarray, scalar
+        The value(s) for which to convert the unit prefix.
     p_in: string, any of the above, optional
         The current prefix of :code:`val`. If :code:`p_in` is undefined,
         :code:`val` has no SI unit prefix.
@@ -366,24 +495,36 @@ def refix(val, p_in="", p_out=""):
 
     Returns
     -------
-    val_refix: scalar
-        The value in units of prefix :code:`p_out`.
+    val_refix: ndarray, scalar
+        The value(s) in units of prefix :code:`p_out`.
 
     """
-    prefix = {
-        'p': 10 ** -12,
-        'n': 10 ** -9,
-        'mu': 10 ** -6,
-        'm': 10 ** -3,
-        '': 10 ** -0,
-        'k': 10 ** 3,
-        'M': 10 ** 6,
-        'G': 10 ** 9,
-        'T': 10 ** 12
-    }
-    val_refix = val * prefix[p_in] / prefix[p_out]
+    val_refix = val * __SI_FACTOR[(p_in, p_out)]
     return val_refix
 
 
-if __name__ == "__main__":
-    pass
+def refixfactor(p_in="", p_out=""):
+    """
+
+    Calculate the factor that converts values from SI unit prefix :code:`p_in`
+    to SI unit prefix :code:`p_out`. See :code:`refix` for available
+    prefixes. Use this function to calculate the factor once if many values
+    need to be converted separately.
+
+    Parameters
+    ----------
+    p_in: string, optional
+        The current prefix. If :code:`p_in` is undefined, the values have no
+        SI unit prefix.
+    p_out: string, optional
+        The prefix after the conversion. If :code:`p_out` is undefined, the
+        values have no SI unit prefix after the conversion.
+
+    Returns
+    -------
+    factor: scalar
+        The conversion factor.
+
+    """
+    factor = __SI_FACTOR[(p_in, p_out)]
+    return factor